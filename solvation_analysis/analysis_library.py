@@ -20,7 +20,6 @@ import warnings
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 from statsmodels.tsa.stattools import acovf
 from scipy.optimize import curve_fit
 from scipy.sparse import csr_matrix
@@ -185,27 +184,20 @@ class Speciation:
 
     def _solvent_co_occurrence(self):
         # calculate the co-occurrence of solvent molecules.
-        expected_solvents_list = []
-        actual_solvents_list = []
-        for solvent in self.speciation_data.columns.values:
-            # calculate number of available coordinating solvent slots
-            shells_w_solvent = self.speciation_data.query(f'{solvent} > 0')
-            n_solvents = shells_w_solvent.sum()
-            # calculate expected number of coordinating solvents
-            n_coordination_slots = n_solvents.sum() - len(shells_w_solvent)
-            coordination_percentage = self.speciation_data.sum() / self.speciation_data.sum().sum()
-            expected_solvents = coordination_percentage * n_coordination_slots
-            # calculate actual number of coordinating solvents
-            actual_solvents = n_solvents.copy()
-            actual_solvents[solvent] = actual_solvents[solvent] - len(shells_w_solvent)
-            # name series and append to list
-            expected_solvents.name = solvent
-            actual_solvents.name = solvent
-            expected_solvents_list.append(expected_solvents)
-            actual_solvents_list.append(actual_solvents)
-        # make DataFrames
-        actual_df = pd.concat(actual_solvents_list, axis=1)
-        expected_df = pd.concat(expected_solvents_list, axis=1)
+        # column j of n_solvents counts every solvent in the shells containing solvent j
+        has_solvent = (self.speciation_data > 0).astype(int)
+        n_solvents = self.speciation_data.T.dot(has_solvent)
+        n_shells = has_solvent.sum()
+        # calculate expected number of coordinating solvents
+        n_coordination_slots = n_solvents.sum() - n_shells
+        coordination_percentage = self.speciation_data.sum() / self.speciation_data.sum().sum()
+        expected_df = pd.DataFrame(
+            np.outer(coordination_percentage, n_coordination_slots),
+            index=n_solvents.index,
+            columns=n_solvents.columns,
+        )
+        # calculate actual number of coordinating solvents, excluding the solvent itself
+        actual_df = n_solvents - np.diag(n_shells)
         # calculate correlation matrix
         correlation = actual_df / expected_df
         return correlation
@@ -222,6 +214,7 @@ class Speciation:
         ax : matplotlib.Axes
 
         """
+        import matplotlib.pyplot as plt
         solvent_names = self.speciation_data.columns.values
         fig, ax = plt.subplots()
         im = ax.imshow(self.co_occurrence)
@@ -348,8 +341,7 @@ class Coordination:
         type_counts = atoms_by_type.groupby(['res_name', 'atom_type']).count()
         solvent_counts = type_counts.groupby(['res_name']).sum()['atom_ix']
         # calculate percent of each
-        solvent_counts_list = [solvent_counts[solvent] for solvent in type_counts.index.get_level_values(0)]
-        type_percents = type_counts['atom_ix'] / solvent_counts_list
+        type_percents = type_counts['atom_ix'].div(solvent_counts, level='res_name')
         type_percents.name = 'percent'
         # change index type
         type_percents = (type_percents
@@ -458,8 +450,8 @@ class Pairing:
         # calculate the percent of each solvent NOT coordinated with the solute
         counts = self.solvation_data.groupby(["frame", "res_ix", "res_name"]).count()['dist']
         totals = counts.groupby(['res_name']).count() / self.n_frames
-        n_solvents = np.array([self.solvent_counts[name] for name in totals.index.values])
-        free_solvents = np.ones(len(totals)) - totals / n_solvents
+        n_solvents = pd.Series(self.solvent_counts).reindex(totals.index)
+        free_solvents = 1 - totals / n_solvents
         return free_solvents.to_dict()
 
     def _diluent_composition(self):
@@ -593,13 +585,11 @@ class Residence:
                 warnings.warn(f'the autocovariance for {res_name} does not converge to zero '
                               'so a residence time cannot be calculated. A longer simulation '
                               'is required to get a valid estimate of the residence time.')
-            unassigned = True
-            for frame, val in enumerate(auto_covariance):
-                if val < 1 / math.e:
-                    residence_times[res_name] = frame * step
-                    unassigned = False
-                    break
-            if unassigned:
+            below_cutoff = auto_covariance < 1 / math.e
+            if below_cutoff.any():
+                # the first frame where the autocovariance drops below 1/e
+                residence_times[res_name] = int(np.argmax(below_cutoff)) * step
+            else:
                 residence_times[res_name] = np.nan
         return residence_times
 
@@ -629,18 +619,18 @@ class Residence:
         fig : matplotlib.Figure
         ax : matplotlib.Axes
         """
+        import matplotlib.pyplot as plt
         auto_covariance = self.auto_covariances[res_name]
         frames = np.arange(len(auto_covariance))
         params = self.fit_parameters[res_name]
-        exp_func = lambda x: self._exponential_decay(x, *params)
-        exp_fit = np.array(map(exp_func, frames))
         fig, ax = plt.subplots()
         ax.plot(frames, auto_covariance, "b-", label="auto covariance")
-        try:
-            ax.scatter(frames, exp_fit, label="exponential fit")
-        except:
+        if np.isnan(params).any():
             warnings.warn(f'The fit for {res_name} failed so the exponential '
                           f'fit will not be plotted.')
+        else:
+            exp_fit = self._exponential_decay(frames, *params)
+            ax.scatter(frames, exp_fit, label="exponential fit")
         ax.hlines(y=1/math.e, xmin=frames[0], xmax=frames[-1], label='1/e cutoff')
         ax.set_xlabel("Timestep (frames)")
         ax.set_ylabel("Normalized Autocovariance")
@@ -884,10 +874,8 @@ class Networking:
 
     def _calculate_network_sizes(self):
         # This utility calculates the network sizes and returns a convenient dataframe.
-        cluster_df = self.network_df
-        cluster_sizes = cluster_df.groupby(['frame', 'network']).count()
-        size_counts = cluster_sizes.groupby(['frame', 'res_name']).count().unstack(fill_value=0)
-        size_counts.columns = size_counts.columns.droplevel()
+        cluster_sizes = self.network_df.groupby(['frame', 'network']).size()
+        size_counts = cluster_sizes.groupby(['frame']).value_counts().unstack(fill_value=0)
         return size_counts
 
     def _calculate_solute_status(self):
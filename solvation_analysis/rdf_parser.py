@@ -13,7 +13,6 @@ from an RDF.
 import numpy as np
 from scipy.interpolate import UnivariateSpline
 import scipy
-import matplotlib.pyplot as plt
 import warnings
 from scipy.signal import find_peaks, gaussian
 
@@ -92,6 +91,7 @@ def plot_interpolation_fit(bins, rdf, **kwargs):
     fig, ax : matplotlib pyplot Figure and Axis for the fit
 
     """
+    import matplotlib.pyplot as plt
     f, bounds = interpolate_rdf(bins, rdf, **kwargs)
     x = np.linspace(bounds[0], bounds[1], num=100)
     y = f(x)
@@ -293,6 +293,7 @@ def plot_scipy_find_peaks_troughs(
     fig, ax : matplotlib pyplot Figure and Axis for the fit
 
     """
+    import matplotlib.pyplot as plt
     peaks, troughs, smooth_rdf = scipy_find_peaks_troughs(bins, rdf, return_rdf=True, **kwargs)
     fig, ax = plt.subplots()
     ax.plot(bins, rdf, "b--", label="rdf")
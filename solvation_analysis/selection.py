@@ -17,7 +17,7 @@ surrounding specific solutes.
 import warnings
 import numpy as np
 import MDAnalysis as mda
-from MDAnalysis.analysis import distances
+from MDAnalysis.analysis.base import AnalysisBase
 
 
 def get_atom_group(selection):
@@ -47,10 +47,78 @@ def get_atom_group(selection):
     if isinstance(selection, (mda.core.groups.Residue, mda.core.groups.ResidueGroup)):
         selection = selection.atoms
     if isinstance(selection, mda.core.groups.Atom):
-        selection = u.select_atoms(f"index {selection.index}")
+        selection = u.atoms[[selection.index]]
     return selection
 
 
+def _closest_n_resix(radii, resix, n):
+    """
+    Find the n closest residues, given the distance and resix of a set of atoms.
+
+    Each residue is ranked by the distance of its closest atom.
+
+    Parameters
+    ----------
+    radii : numpy.array of float
+        the distance of each atom from the center
+    resix : numpy.array of int
+        the residue index of each atom
+    n : int
+        the number of residues to return
+
+    Returns
+    -------
+    ordered_resix : numpy.array of int
+        the residue index of the n closest residues, ordered by radius
+    ordered_radii : numpy.array of float
+        the distance of the closest atom of each of the n residues
+    """
+    ordering = np.argsort(radii)
+    first_ix = np.unique(resix[ordering], return_index=True)[1]
+    closest_ix = ordering[np.sort(first_ix)[0:n]]
+    return resix[closest_ix], radii[closest_ix]
+
+
+def _search_closest_n_resix(u, coords, n, guess_radius):
+    """
+    Find the n closest residues to a point in the current frame of the universe.
+
+    The search radius starts at guess_radius and is grown until at least
+    n residues have an atom within it. Since the number of residues found
+    scales with the volume searched, the radius is grown geometrically.
+
+    Parameters
+    ----------
+    u : MDAnalysis.Universe
+    coords : numpy.array of float
+        the point to search around
+    n : int
+        the number of residues to return
+    guess_radius : float or int
+        an initial search radius
+
+    Returns
+    -------
+    ordered_resix : numpy.array of int
+        the residue index of the n closest residues, ordered by radius
+    ordered_radii : numpy.array of float
+        the distance of the closest atom of each of the n residues
+    """
+    assert n <= len(u.residues), "cannot select more residues than are in the universe"
+    radius = guess_radius
+    while True:
+        pairs, radii = mda.lib.distances.capped_distance(
+            coords, u.atoms.positions, radius, return_distances=True, box=u.dimensions
+        )
+        shell_resix = u.atoms.resindices[pairs[:, 1]]
+        n_found = len(np.unique(shell_resix))
+        if n_found >= n:
+            break
+        growth = max(1.5, 1.1 * (n / max(n_found, 1)) ** (1 / 3))
+        radius = max(radius * growth, radius + 1)
+    return _closest_n_resix(radii, shell_resix, n)
+
+
 def get_closest_n_mol(
     central_species,
     n_mol,
@@ -88,43 +156,87 @@ def get_closest_n_mol(
     u = central_species.universe
     central_species = get_atom_group(central_species)
     coords = central_species.center_of_mass()
-    pairs, radii = mda.lib.distances.capped_distance(
-        coords, u.atoms.positions, guess_radius, return_distances=True, box=u.dimensions
-    )
-    partial_shell = u.atoms[pairs[:, 1]]
-    shell_resix = partial_shell.resindices
-    if len(np.unique(shell_resix)) < n_mol + 1:
-        return get_closest_n_mol(
-            central_species,
-            n_mol,
-            guess_radius + 1,
-            return_ordered_resix=return_ordered_resix,
-            return_radii=return_radii
-        )
-    radii = distances.distance_array(coords, partial_shell.positions, box=u.dimensions)[
-        0
-    ]
-    ordering = np.argsort(radii)
-    ordered_resix = shell_resix[ordering]
-    closest_n_resix = np.sort(np.unique(ordered_resix, return_index=True)[1])[
-        0: n_mol + 1
-    ]
-    str_resix = " ".join(str(resix) for resix in ordered_resix[closest_n_resix])
-    full_shell = u.select_atoms(f"resindex {str_resix}")
+    ordered_resix, ordered_radii = _search_closest_n_resix(u, coords, n_mol + 1, guess_radius)
+    full_shell = u.residues[np.sort(ordered_resix)].atoms
     if return_ordered_resix and return_radii:
-        return (
-            full_shell,
-            ordered_resix[closest_n_resix],
-            radii[ordering][closest_n_resix],
-        )
+        return full_shell, ordered_resix, ordered_radii
     elif return_ordered_resix:
-        return full_shell, ordered_resix[closest_n_resix]
+        return full_shell, ordered_resix
     elif return_radii:
-        return full_shell, radii[ordering][closest_n_resix]
+        return full_shell, ordered_radii
     else:
         return full_shell
 
 
+class _ClosestNMol(AnalysisBase):
+    """
+    Find the closest n molecules to a central species at every frame.
+
+    Results are written into preallocated arrays, see
+    get_closest_n_mol_trajectory.
+    """
+
+    def __init__(self, central_species, n_mol, guess_radius=3, verbose=False):
+        super(_ClosestNMol, self).__init__(central_species.universe.trajectory, verbose=verbose)
+        self.u = central_species.universe
+        self.central_species = get_atom_group(central_species)
+        self.n_mol = n_mol
+        self.guess_radius = guess_radius
+
+    def _prepare(self):
+        self.results.resix = np.empty((self.n_frames, self.n_mol + 1), dtype=np.int64)
+        self.results.radii = np.empty((self.n_frames, self.n_mol + 1), dtype=np.float64)
+
+    def _single_frame(self):
+        coords = self.central_species.center_of_mass()
+        resix, radii = _search_closest_n_resix(self.u, coords, self.n_mol + 1, self.guess_radius)
+        self.results.resix[self._frame_index] = resix
+        self.results.radii[self._frame_index] = radii
+
+
+def get_closest_n_mol_trajectory(
+    central_species,
+    n_mol,
+    guess_radius=3,
+    start=None,
+    stop=None,
+    step=None,
+):
+    """
+    Returns the resix and distance of the closest n molecules at every frame.
+
+    Equivalent to calling get_closest_n_mol with return_ordered_resix and
+    return_radii at each frame of the trajectory, but the results are collected
+    into two arrays instead of one AtomGroup per frame.
+
+    Parameters
+    ----------
+    central_species : MDAnalysis.Atom, MDAnalysis.AtomGroup, MDAnalysis.Residue or MDAnalysis.ResidueGroup
+    n_mol : int
+        The number of molecules to return
+    guess_radius : float or int
+        an initial search radius to look for closest n mol
+    start : int, optional
+        the first frame to analyze
+    stop : int, optional
+        the frame to stop analysis at
+    step : int, optional
+        the number of frames between analyzed frames
+
+    Returns
+    -------
+    ordered_resix : numpy.array of int
+        shape (n_frames, n_mol + 1), the residue index of the closest
+        molecules at each frame, ordered by radius
+    radii : numpy.array of float
+        shape (n_frames, n_mol + 1), the distance of the closest atom
+        of each molecule at each frame
+    """
+    closest = _ClosestNMol(central_species, n_mol, guess_radius=guess_radius)
+    closest.run(start=start, stop=stop, step=step)
+    return closest.results.resix, closest.results.radii
+
+
 def get_radial_shell(central_species, radius):
     """
     Returns all molecules with atoms within the radius of the central species.
@@ -144,7 +256,40 @@ def get_radial_shell(central_species, radius):
     u = central_species.universe
     central_species = get_atom_group(central_species)
     coords = central_species.center_of_mass()
-    str_coords = " ".join(str(coord) for coord in coords)
-    partial_shell = u.select_atoms(f"point {str_coords} {radius}")
-    full_shell = partial_shell.residues.atoms
+    pairs = mda.lib.distances.capped_distance(
+        coords, u.atoms.positions, radius, return_distances=False, box=u.dimensions
+    )
+    full_shell = u.atoms[pairs[:, 1]].residues.atoms
     return full_shell
+
+
+def get_radial_shells(central_species_list, radius):
+    """
+    Returns all molecules with atoms within the radius of each central species.
+
+    Equivalent to calling get_radial_shell on each central species, but the
+    centers of mass are stacked and searched with a single neighbor search.
+    All central species must belong to the same Universe.
+
+    Parameters
+    ----------
+    central_species_list : list of MDAnalysis.Atom, MDAnalysis.AtomGroup, MDAnalysis.Residue, or MDAnalysis.ResidueGroup
+    radius : float or int
+        radius used for atom selection
+
+    Returns
+    -------
+    list of MDAnalysis.AtomGroup
+        the shell of each central species, in the order given
+
+    """
+    u = central_species_list[0].universe
+    coords = np.vstack(
+        [get_atom_group(central_species).center_of_mass() for central_species in central_species_list]
+    )
+    pairs = mda.lib.distances.capped_distance(
+        coords, u.atoms.positions, radius, return_distances=False, box=u.dimensions
+    )
+    pairs = pairs[np.argsort(pairs[:, 0], kind="stable")]
+    splits = np.searchsorted(pairs[:, 0], np.arange(1, len(coords)))
+    return [u.atoms[atom_ix].residues.atoms for atom_ix in np.split(pairs[:, 1], splits)]
@@ -21,7 +21,6 @@ shell, returning an AtomGroup for visualization or further analysis.
 """
 
 
-import matplotlib.pyplot as plt
 import pandas as pd
 import warnings
 
@@ -168,8 +167,9 @@ class Solution(AnalysisBase):
         verbose=False,
     ):
         super(Solution, self).__init__(solute.universe.trajectory, verbose=verbose)
-        self.radii = radii or {}
-        self.solvent_counts = solvent_counts or {}
+        # copy so that filling in missing values does not modify the caller's dicts
+        self.radii = dict(radii or {})
+        self.solvent_counts = dict(solvent_counts or {})
         for name in solvents.keys():
             if name not in self.solvent_counts.keys():
                 self.solvent_counts[name] = len(solvents[name].residues)
@@ -243,13 +243,16 @@ class Solution(AnalysisBase):
         pairs_list = []
         dist_list = []
         tags_list = []
+        # the solute positions and box are shared by every solvent in this frame
+        solute_positions = self.solute.positions
+        box = self.u.dimensions
         # loop to find solvated atoms of each type
         for name, solvent in self.solvents.items():
             pairs, dist = capped_distance(
-                self.solute.positions,
+                solute_positions,
                 solvent.positions,
                 self.radii[name],
-                box=self.u.dimensions,
+                box=box,
             )
             # replace local ids with absolute ids
             pairs[:, 1] = solvent.ix[[pairs[:, 1]]]
@@ -325,6 +328,7 @@ class Solution(AnalysisBase):
         fig : matplotlib.Figure
         ax : matplotlib.Axes
         """
+        import matplotlib.pyplot as plt
         fig, ax = plt.subplots()
         ax.plot(bins, data, "b-", label="rdf")
         ax.axvline(radius, color="r", label="solvation radius")
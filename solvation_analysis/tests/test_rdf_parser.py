@@ -1,7 +1,6 @@
 import MDAnalysis as mda
 import numpy as np
 
-import matplotlib.pyplot as plt
 import pytest
 from solvation_analysis.rdf_parser import (
     identify_minima,
@@ -11,7 +11,9 @@ import pytest
 from solvation_analysis.selection import (
     get_atom_group,
     get_closest_n_mol,
+    get_closest_n_mol_trajectory,
     get_radial_shell,
+    get_radial_shells,
 )
 
 
@@ -73,6 +75,29 @@ def test_get_closest_n_mol_radii_invariance(radius, u_real, atom_groups):
     np.testing.assert_allclose(radii, default_radii)
 
 
+def test_get_closest_n_mol_too_many(u_grid_1):
+    # test that asking for more molecules than exist fails instead of searching forever
+    with pytest.raises(AssertionError):
+        get_closest_n_mol(u_grid_1.atoms[0], n_mol=len(u_grid_1.residues))
+
+
+@pytest.mark.parametrize("step", [1, 3])
+def test_get_closest_n_mol_trajectory(step, u_real, atom_groups):
+    # test that the trajectory results match frame by frame selection, on real system
+    test_li = atom_groups["li"][0]
+    resix, radii = get_closest_n_mol_trajectory(test_li, 5, step=step)
+    frames = range(0, len(u_real.trajectory), step)
+    assert resix.shape == radii.shape == (len(frames), 6)
+    for i, frame in enumerate(frames):
+        u_real.trajectory[frame]
+        _, frame_resix, frame_radii = get_closest_n_mol(
+            test_li, 5, return_ordered_resix=True, return_radii=True
+        )
+        np.testing.assert_array_equal(resix[i], frame_resix)
+        np.testing.assert_allclose(radii[i], frame_radii)
+    u_real.trajectory[0]
+
+
 @pytest.mark.parametrize(
     "distance, expected_sizes",
     [(0.95, [1, 1, 1, 1]), (1.05, [4, 5, 6, 7]), (1.45, [7, 10, 14, 19])],
@@ -107,3 +132,22 @@ def test_get_radial_shell_correct_ix_grid(center_ix, expected_ix, u_grid_1):
     test_atom = u_grid_1.atoms[center_ix]
     shell_ix = get_radial_shell(test_atom, 1.05).resindices
     np.testing.assert_array_equal(shell_ix, expected_ix)
+
+
+@pytest.mark.parametrize("radius", [0.95, 1.05, 1.45])
+def test_get_radial_shells_matches_radial_shell_grid(radius, u_grid_1):
+    # test that the batched shells match the single shells, on grid system
+    test_atoms = u_grid_1.atoms[[0, 3, 10, 44]]
+    shells = get_radial_shells(test_atoms, radius)
+    assert len(shells) == len(test_atoms)
+    for atom, shell in zip(test_atoms, shells):
+        assert shell == get_radial_shell(atom, radius)
+
+
+@pytest.mark.parametrize("radius", [2, 3, 4, 5, 6, 7])
+def test_get_radial_shells_matches_radial_shell_real(radius, u_real, atom_groups):
+    # test that the batched shells match the single shells, on real system
+    test_lis = atom_groups["li"][0:5]
+    shells = get_radial_shells(test_lis, radius)
+    for li, shell in zip(test_lis, shells):
+        assert shell == get_radial_shell(li, radius)
@@ -1,4 +1,3 @@
-import matplotlib.pyplot as plt
 import warnings
 import pytest
 from solvation_analysis.solution import Solution
@@ -50,6 +49,23 @@ def test_run_warning(pre_solution_mutable):
         pre_solution_mutable.run(step=1)
 
 
+def test_run_does_not_mutate_inputs(atom_groups):
+    # checks that the radii and solvent_counts passed in are not modified
+    radii = {'pf6': 2.8}
+    solvent_counts = {}
+    solution = Solution(
+        atom_groups['li'],
+        {'pf6': atom_groups['pf6'], 'bn': atom_groups['bn'], 'fec': atom_groups['fec']},
+        radii=radii,
+        solvent_counts=solvent_counts,
+        rdf_init_kwargs={"range": (0, 8.0)},
+    )
+    solution.run(step=1)
+    assert len(solution.radii) == 3
+    assert radii == {'pf6': 2.8}
+    assert solvent_counts == {}
+
+
 def test_run(pre_solution_mutable):
     # checks that run is run correctly
     pre_solution_mutable.radii = {'pf6': 2.8}